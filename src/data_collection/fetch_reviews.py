@@ -14,16 +14,36 @@ import os
 import sys
 import pandas as pd
 import argparse
+import asyncio
+import contextlib
+import functools
+import hashlib
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Tuple
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, List, Dict, Tuple, Union
 import time
 import json
+import numpy as np
 
 # Third-party imports
 try:
+    import diskcache
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pcsv
+    import pyarrow.parquet as pq
+    import requests
+    import yaml
     from google_play_scraper import Sort, reviews as gp_reviews
-    from app_store_web_scraper import AppStoreEntry
+    from google_play_scraper.exceptions import ExtraHTTPError
+    from tenacity import (
+        before_sleep_log, retry, retry_if_exception,
+        stop_after_attempt, wait_exponential_jitter
+    )
 except ImportError as e:
     print(f"Error: Missing required packages. Please install: {e}")
     sys.exit(1)
@@ -53,18 +73,326 @@ SECURITY_KEYWORDS = [
     'permissions', 'access', 'tracking', 'surveillance', 'leak'
 ]
 
+# Keywords are stems ("hack" -> "hacked"), so only the start of a word is anchored.
+# The case-insensitive flag is inline so pyarrow can run the pattern natively.
+SECURITY_RE = re.compile(
+    r'(?i)\b(?:' + '|'.join(map(re.escape, SECURITY_KEYWORDS)) + r')'
+)
+
+# App ID formats: dotted package names for Google, numeric IDs for Apple
+GOOGLE_APP_ID_RE = re.compile(r'\w+(?:\.\w+)+')
+APPLE_APP_ID_RE = re.compile(r'\d{6,}')
+
+# Typed layout of the review columns shared by both platforms
+REVIEW_SCHEMA = pa.schema([
+    ('reviewId', pa.string()),
+    ('userName', pa.string()),
+    ('content', pa.string()),
+    ('score', pa.int8()),
+    ('at', pa.timestamp('s', tz='UTC')),
+])
+
+# Processed reviews: the raw columns plus metadata and the security flag
+PROCESSED_SCHEMA = REVIEW_SCHEMA.append(
+    pa.field('platform', pa.dictionary(pa.int8(), pa.string()))
+).append(
+    pa.field('fetched_at', pa.timestamp('s'))
+).append(
+    pa.field('is_security_related', pa.bool_())
+)
+
+# Pandas dtypes for the Arrow columns: pyarrow-backed strings, nullable int8 scores
+REVIEW_DTYPES = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.int8(): pd.Int8Dtype(),
+}
+
+# On-disk cache of fetched pages, so repeated and interrupted runs resume
+CACHE_DIR = os.path.join(RAW_DIR, ".cache")
+CACHE_EXPIRE = 7 * 24 * 60 * 60
+
+# Output file settings
+OUTPUT_FORMATS = ['parquet', 'csv']
+PARQUET_COMPRESSION = 'zstd'
+PARQUET_ROW_GROUP_SIZE = 50000
+
+# Google Play pagination settings
+GOOGLE_HOST = "play.google.com"
+# google-play-scraper sends one request per 199 reviews (MAX_COUNT_EACH_FETCH);
+# larger batches cost extra requests the rate limiter does not see
+GOOGLE_BATCH_SIZE = 199
+GOOGLE_SCORE_FILTERS = [1, 2, 3, 4, 5]
+
+# Apple App Store reviews feed (the iTunes RSS feed serves at most 10 pages)
+APPLE_HOST = "itunes.apple.com"
+APPLE_REVIEWS_URL = (
+    "https://itunes.apple.com/{country}/rss/customerreviews/"
+    "page={page}/id={app_id}/sortby=mostrecent/json"
+)
+APPLE_PAGE_SIZE = 50
+APPLE_MAX_PAGES = 10
+
+# Retry settings for transient request failures
+REQUEST_TIMEOUT = 30
+MAX_ATTEMPTS = 6
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Return True for transient errors worth retrying (network, 429, 5xx)."""
+    if isinstance(exc, requests.HTTPError):
+        status = exc.response.status_code if exc.response is not None else None
+        return status is None or status == 429 or status >= 500
+    return isinstance(exc, (OSError, ExtraHTTPError))
+
+
+def _match_security(
+    content: Union[pa.Array, pa.ChunkedArray]
+) -> Union[pa.Array, pa.ChunkedArray]:
+    """Flag review texts matching SECURITY_RE; missing text is not flagged."""
+    return pc.fill_null(pc.match_substring_regex(content, SECURITY_RE.pattern), False)
+
+
+def flag_security_related(content: pd.Series) -> pd.Series:
+    """
+    Flag reviews whose text mentions a security keyword.
+    
+    Text of any dtype, e.g. archived reviews re-read from CSV, goes
+    through the same Arrow matcher as a fetch, so it gets the same flags.
+    """
+    try:
+        text = pa.array(content, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed columns: only string values can match
+        text = pa.array([v if isinstance(v, str) else None for v in content], type=pa.string())
+    
+    return pd.Series(
+        _match_security(text).to_numpy(zero_copy_only=False),
+        index=content.index,
+        dtype=bool
+    )
+
+
+def _to_timestamps(values: List) -> pa.Array:
+    """
+    Convert review timestamps to the 'at' type of REVIEW_SCHEMA.
+    
+    Datetimes and epoch seconds convert directly and ISO-8601 strings are
+    parsed inside Arrow; only values neither path understands fall back
+    to a lenient pandas parse (unparseable values become null).
+    """
+    at_type = REVIEW_SCHEMA.field('at').type
+    try:
+        return pa.array(values, at_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+    
+    try:
+        return pa.array(values, pa.string()).cast(at_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        parsed = pd.to_datetime(pd.Series(values, dtype=object), errors='coerce', utc=True)
+        return pa.array(parsed.dt.floor('s'), at_type)
+
+
+def _add_text_stats(table: pa.Table) -> pa.Table:
+    """Append the processed-output content_length and word_count columns."""
+    # int32 whatever the string offset width
+    content = table.column('content')
+    table = table.append_column('content_length', pc.utf8_length(content).cast(pa.int32()))
+    return table.append_column(
+        'word_count', pc.count_substring_regex(content, r'\S+').cast(pa.int32())
+    )
+
+
+def _cache_key(*parts) -> str:
+    """Build a stable cache key from the parameters identifying a page."""
+    return hashlib.blake2b('|'.join(map(str, parts)).encode()).hexdigest()
+
+
+def _retry_after(headers) -> float:
+    """Seconds to wait as requested by Retry-After or X-RateLimit-Reset headers."""
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+            except (TypeError, ValueError):
+                pass
+    
+    reset_at = headers.get('X-RateLimit-Reset')
+    if reset_at:
+        try:
+            return max(0.0, float(reset_at) - time.time())
+        except ValueError:
+            pass
+    
+    return 0.0
+
+
+class AppNotFoundError(Exception):
+    """Raised when a store has no app with the requested ID."""
+
+
+class RateLimiter:
+    """Token-bucket rate limiter for the requests sent to one host."""
+    
+    def __init__(self, refill_rate: float, capacity: int = 1):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            refill_rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum number of tokens, i.e. the allowed burst size
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.next_allowed_at = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                elapsed = now - self.updated_at
+                if elapsed > 0:
+                    self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+                    self.updated_at = now
+                
+                wait = self.next_allowed_at - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.refill_rate
+                
+                await asyncio.sleep(wait)
+    
+    def defer(self, seconds: float):
+        """Hold back all further requests for the given number of seconds."""
+        self.next_allowed_at = max(self.next_allowed_at, time.monotonic() + seconds)
+
+
 class ReviewFetcher:
     """Enhanced review fetcher with improved functionality."""
     
-    def __init__(self, delay: float = 1.0):
+    def __init__(self, delay: float = 1.0, concurrency: int = 8,
+                 cache_dir: Optional[str] = CACHE_DIR):
         """
         Initialize the review fetcher.
         
         Args:
             delay: Delay between requests to respect rate limits
+            concurrency: Maximum number of requests in flight at once
+            cache_dir: Directory for the on-disk page cache (None disables it)
         """
         self.delay = delay
+        self.concurrency = max(1, concurrency)
         self.stats = {'fetched': 0, 'errors': 0, 'security_related': 0}
+        self._cache = diskcache.Cache(cache_dir) if cache_dir else None
+        self._session = requests.Session()
+        self._limiters = {}
+        self._semaphore = None
+        self._executor = None
+        self._scope_depth = 0
+    
+    @contextlib.asynccontextmanager
+    async def _session_scope(self):
+        """
+        Set up the semaphore, thread pool and rate limiters on the current loop.
+        
+        Scopes nest: fetches running together share the outermost scope,
+        which shuts the thread pool down once the last of them finishes.
+        """
+        if not self._scope_depth:
+            self._limiters = {}
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        self._scope_depth += 1
+        try:
+            yield
+        finally:
+            self._scope_depth -= 1
+            if not self._scope_depth:
+                self._executor.shutdown()
+                self._executor = None
+                self._semaphore = None
+    
+    def _run(self, coro_fn, *args):
+        """
+        Run an async fetch on a fresh event loop with its own limiters.
+        
+        Inside an already running loop (e.g. Jupyter), where
+        ``asyncio.run`` is not allowed, the fresh loop runs on a worker
+        thread instead.
+        """
+        async def runner():
+            async with self._session_scope():
+                return await coro_fn(*args)
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(runner())
+        
+        with ThreadPoolExecutor(max_workers=1) as loop_thread:
+            return loop_thread.submit(asyncio.run, runner()).result()
+    
+    def _limiter(self, host: str) -> RateLimiter:
+        """Return the rate limiter shared by all requests to ``host``."""
+        if host not in self._limiters:
+            refill_rate = 1 / self.delay if self.delay > 0 else float('inf')
+            self._limiters[host] = RateLimiter(refill_rate, capacity=self.concurrency)
+        return self._limiters[host]
+    
+    @retry(
+        wait=wait_exponential_jitter(initial=0.5, max=30),
+        stop=stop_after_attempt(MAX_ATTEMPTS),
+        retry=retry_if_exception(_is_retryable),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True
+    )
+    async def _request(self, host: str, func, *args, **kwargs):
+        """
+        Call a blocking request function on the thread pool.
+        
+        The call is rate limited per host and retried with exponential
+        backoff on transient failures. HTTP responses asking us to slow
+        down (429/503) hold back the host for the advertised time.
+        """
+        limiter = self._limiter(host)
+        await limiter.acquire()
+        
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(func, *args, **kwargs)
+            )
+        
+        if isinstance(result, requests.Response):
+            if result.status_code in (429, 503):
+                limiter.defer(_retry_after(result.headers))
+            result.raise_for_status()
+        
+        return result
+    
+    async def _cached(self, key_parts: tuple, fetch):
+        """Return a cached page for ``key_parts``, awaiting ``fetch()`` on a miss."""
+        if self._cache is None:
+            return await fetch()
+        
+        key = _cache_key(*key_parts)
+        payload = self._cache.get(key)
+        if payload is None:
+            payload = await fetch()
+            self._cache.set(key, payload, expire=CACHE_EXPIRE)
+        else:
+            logger.debug("Cache hit for %s", key_parts)
+        return payload
     
     def fetch_google_reviews(
         self, 
@@ -72,232 +400,668 @@ class ReviewFetcher:
         lang: str = "en", 
         country: str = "us", 
         max_reviews: int = 10000,
-        sort_by: Sort = Sort.NEWEST
-    ) -> pd.DataFrame:
+        sort_by: Sort = Sort.NEWEST,
+        as_table: bool = False
+    ) -> Union[pd.DataFrame, pa.Table]:
         """
         Fetch reviews from Google Play Store with enhanced error handling.
+        
+        With ``as_table=True`` the reviews are returned as a pyarrow Table
+        and never go through pandas.
+        """
+        try:
+            table = self._run(
+                self.fetch_google_async, app_id, lang, country, max_reviews, sort_by
+            )
+        except KeyboardInterrupt:
+            logger.info("Fetch interrupted by user")
+            table = PROCESSED_SCHEMA.empty_table()
+        
+        return self._output(table, as_table)
+    
+    async def fetch_google_async(
+        self, 
+        app_id: str, 
+        lang: str = "en", 
+        country: str = "us", 
+        max_reviews: int = 10000,
+        sort_by: Sort = Sort.NEWEST
+    ) -> pa.Table:
+        """
+        Coroutine behind ``fetch_google_reviews``, returning a pyarrow Table.
+        
+        Can be awaited from any event loop; fetches gathered together share
+        one thread pool and the per-host rate limiters.
         """
         logger.info(f"Starting Google Play reviews fetch for {app_id}")
         logger.info(f"Parameters: lang={lang}, country={country}, max_reviews={max_reviews}")
         
         all_reviews = []
-        token = None
-        batch_size = 200
         
         try:
-            while len(all_reviews) < max_reviews:
-                batch_count = min(batch_size, max_reviews - len(all_reviews))
+            async with self._session_scope():
+                await self._fetch_google_async(
+                    app_id, lang, country, max_reviews, sort_by, all_reviews.extend
+                )
+        except Exception as e:
+            logger.error(f"Unexpected error during fetch of {app_id}: {e}")
+        
+        # Per-score streams overshoot; keep the newest max_reviews overall
+        if sort_by == Sort.NEWEST:
+            all_reviews.sort(key=lambda r: r['at'], reverse=True)
+        del all_reviews[max_reviews:]
+        self.stats['fetched'] += len(all_reviews)
+        
+        if not all_reviews:
+            logger.warning("No reviews were fetched")
+            return PROCESSED_SCHEMA.empty_table()
+        
+        columns = self._google_columns(all_reviews)
+        if columns is None:
+            return PROCESSED_SCHEMA.empty_table()
+        
+        # Convert to a table and validate
+        table = self._process(columns, 'google')
+        logger.info(f"✅ Successfully processed {table.num_rows} Google Play reviews")
+        
+        return table
+    
+    def stream_google_reviews(
+        self,
+        app_id: str,
+        path: str,
+        lang: str = "en",
+        country: str = "us",
+        max_reviews: int = 10000,
+        sort_by: Sort = Sort.NEWEST,
+        processed_path: Optional[str] = None
+    ) -> int:
+        """
+        Fetch Google Play reviews straight into a Parquet file.
+        
+        Each batch is processed, appended to a temporary file and then
+        dropped; the final copy is regrouped into PARQUET_ROW_GROUP_SIZE
+        row groups, and also written with the processed-output columns to
+        ``processed_path`` if given. Review rows held in memory stay at
+        about one row group; the newest-first cutoff still keeps one
+        timestamp per review up to ``max_reviews``. Rows are stored in
+        fetch order. Returns the number of reviews written.
+        """
+        logger.info(f"Streaming Google Play reviews for {app_id} to {path}")
+        logger.info(f"Parameters: lang={lang}, country={country}, max_reviews={max_reviews}")
+        
+        partial_path = f"{path}.partial"
+        writer = None
+        cutoff = None
+        security_before = self.stats['security_related']
+        
+        def write_batch(records: List[Dict]):
+            nonlocal writer
+            columns = self._google_columns(records)
+            if columns is None:
+                return
+            
+            table = self._process(columns, 'google')
+            if not table.num_rows:
+                return
+            
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    partial_path, table.schema, compression=PARQUET_COMPRESSION
+                )
+            writer.write_table(table)
+        
+        try:
+            cutoff = self._run(
+                self._fetch_google_async,
+                app_id, lang, country, max_reviews, sort_by, write_batch
+            )
+        except KeyboardInterrupt:
+            logger.info("Fetch interrupted by user")
+        except Exception as e:
+            logger.error(f"Unexpected error during fetch: {e}")
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        if writer is None:
+            logger.warning("No reviews were fetched")
+            return 0
+        
+        # Per-score streams overshoot; drop rows older than the newest max_reviews
+        written, security_related = self._keep_newest(
+            partial_path, path, cutoff, max_reviews, processed_path
+        )
+        self.stats['security_related'] = security_before + security_related
+        self.stats['fetched'] += written
+        logger.info(f"✅ Successfully streamed {written} Google Play reviews")
+        if processed_path:
+            logger.info(f"✅ Processed data saved to: {processed_path}")
+        
+        return written
+    
+    @staticmethod
+    def _google_columns(reviews: List[Dict]) -> Optional[Dict[str, List]]:
+        """Split Google Play review records into REVIEW_SCHEMA columns."""
+        # Validate required columns
+        missing_cols = [col for col in REVIEW_SCHEMA.names if col not in reviews[0]]
+        if missing_cols:
+            logger.error(f"Missing required columns: {missing_cols}")
+            return None
+        
+        # Google returns naive local timestamps; store them as epoch seconds
+        columns = {name: [r[name] for r in reviews] for name in REVIEW_SCHEMA.names}
+        columns['at'] = [int(at.timestamp()) for at in columns['at']]
+        return columns
+    
+    @staticmethod
+    def _keep_newest(
+        src: str,
+        dst: str,
+        cutoff: Optional[datetime],
+        max_reviews: int,
+        processed_dst: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """
+        Copy Parquet ``src`` to ``dst`` keeping rows at or after ``cutoff``.
+        
+        The kept rows are also written with the text statistics columns to
+        ``processed_dst`` if given. Returns the number of rows kept and how
+        many of them are security related.
+        """
+        source = pq.ParquetFile(src)
+        written = 0
+        security_related = 0
+        
+        # Each fetched batch is its own row group in ``src``; regroup them
+        # into PARQUET_ROW_GROUP_SIZE chunks as they are copied
+        pending = []
+        pending_rows = 0
+        
+        with contextlib.ExitStack() as stack:
+            writers = [(stack.enter_context(pq.ParquetWriter(
+                dst, source.schema_arrow, compression=PARQUET_COMPRESSION
+            )), None)]
+            if processed_dst:
+                processed_schema = _add_text_stats(source.schema_arrow.empty_table()).schema
+                writers.append((stack.enter_context(pq.ParquetWriter(
+                    processed_dst, processed_schema, compression=PARQUET_COMPRESSION
+                )), _add_text_stats))
+            
+            def write_group(table: pa.Table):
+                for writer, transform in writers:
+                    writer.write_table(
+                        transform(table) if transform else table,
+                        row_group_size=PARQUET_ROW_GROUP_SIZE
+                    )
+            
+            for batch in source.iter_batches():
+                if cutoff is not None:
+                    at = batch.column(batch.schema.get_field_index('at'))
+                    batch = batch.filter(pc.greater_equal(
+                        at, pa.scalar(cutoff.astimezone(timezone.utc), type=at.type)
+                    ))
+                batch = batch.slice(0, max_reviews - written)
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                written += batch.num_rows
+                security_related += pc.sum(batch.column(
+                    batch.schema.get_field_index('is_security_related')
+                )).as_py() or 0
+                
+                if pending_rows >= PARQUET_ROW_GROUP_SIZE:
+                    table = pa.Table.from_batches(pending)
+                    full = pending_rows - pending_rows % PARQUET_ROW_GROUP_SIZE
+                    write_group(table.slice(0, full))
+                    pending = table.slice(full).to_batches()
+                    pending_rows -= full
+            
+            if pending_rows:
+                write_group(pa.Table.from_batches(pending))
+        
+        os.remove(src)
+        return written, security_related
+    
+    async def _fetch_google_async(
+        self,
+        app_id: str,
+        lang: str,
+        country: str,
+        max_reviews: int,
+        sort_by: Sort,
+        on_batch
+    ) -> Optional[datetime]:
+        """
+        Page through Google Play reviews with concurrent paginators.
+        
+        A continuation token only leads to the next page of its own
+        stream, so one stream cannot be fetched in parallel. For newest-first
+        fetches the reviews are split into one stream per star rating; each
+        stream stops once it runs dry or its pages are older than the newest
+        ``max_reviews`` collected so far. Each batch of records is handed to
+        ``on_batch`` as it arrives so an interrupted run keeps it.
+        
+        Returns the timestamp of the oldest review among the newest
+        ``max_reviews`` fetched, or None if fewer were fetched.
+        """
+        if max_reviews <= 0:
+            return None
+        
+        score_filters = GOOGLE_SCORE_FILTERS if sort_by == Sort.NEWEST else [None]
+        
+        # Per-batch progress is only useful when a single stream is running
+        batch_log_level = logging.INFO if len(score_filters) == 1 else logging.DEBUG
+        
+        # Min-heap of the newest max_reviews timestamps; newest[0] is the cutoff
+        newest = []
+        fetched = 0
+        
+        def reached_cutoff(oldest: datetime) -> bool:
+            return len(newest) >= max_reviews and oldest <= newest[0]
+        
+        async def paginate(score: Optional[int]) -> None:
+            nonlocal fetched
+            token = None
+            head = None
+            label = f"score={score}" if score is not None else "all scores"
+            while fetched < max_reviews or score is not None:
+                if score is None:
+                    batch_count = min(GOOGLE_BATCH_SIZE, max_reviews - fetched)
+                else:
+                    batch_count = min(GOOGLE_BATCH_SIZE, max_reviews)
                 
-                logger.info(f"Fetching batch: {len(all_reviews) + 1}-{len(all_reviews) + batch_count}")
+                logger.debug("Fetching batch (%s): %d reviews", label, batch_count)
                 
+                fetch = functools.partial(
+                    self._request,
+                    GOOGLE_HOST,
+                    gp_reviews,
+                    app_id,
+                    lang=lang,
+                    country=country,
+                    sort=sort_by,
+                    count=batch_count,
+                    filter_score_with=score,
+                    continuation_token=token
+                )
+                
+                # The head of a stream is always fetched live so new reviews show
+                # up; continuation pages are cached under the head's newest review
                 try:
-                    result, token = gp_reviews(
-                        app_id,
-                        lang=lang,
-                        country=country,
-                        sort=sort_by,
-                        count=batch_count,
-                        continuation_token=token
-                    )
-                    
-                    if not result:
-                        logger.info("No more reviews available")
-                        break
-                    
-                    all_reviews.extend(result)
-                    self.stats['fetched'] += len(result)
-                    
-                    logger.info(f"✅ Fetched {len(result)} reviews. Total: {len(all_reviews)}")
-                    
-                    # Respect rate limits
-                    if self.delay > 0:
-                        time.sleep(self.delay)
-                    
                     if token is None:
-                        logger.info("Reached end of available reviews")
-                        break
-                        
+                        result, token = await fetch()
+                        head = result[0]['reviewId'] if result else None
+                    else:
+                        result, token = await self._cached(
+                            ('google', app_id, lang, country, sort_by.name, score,
+                             batch_count, head, token.token),
+                            fetch
+                        )
                 except Exception as e:
-                    logger.error(f"Error fetching batch: {e}")
+                    logger.error(f"Error fetching batch ({label}): {e}")
                     self.stats['errors'] += 1
-                    time.sleep(self.delay * 2)
-                    continue
-                    
-        except KeyboardInterrupt:
-            logger.info("Fetch interrupted by user")
-        except Exception as e:
-            logger.error(f"Unexpected error during fetch: {e}")
-            
-        if not all_reviews:
-            logger.warning("No reviews were fetched")
-            return pd.DataFrame()
+                    break
+                
+                if not result:
+                    logger.info(f"No more reviews available ({label})")
+                    break
+                
+                on_batch(result)
+                fetched += len(result)
+                for review in result:
+                    if len(newest) < max_reviews:
+                        heapq.heappush(newest, review['at'])
+                    elif review['at'] > newest[0]:
+                        heapq.heapreplace(newest, review['at'])
+                
+                logger.log(
+                    batch_log_level,
+                    "✅ Fetched %d reviews (%s). Total: %d", len(result), label, fetched
+                )
+                
+                if token.token is None:
+                    logger.info(f"Reached end of available reviews ({label})")
+                    break
+                
+                if score is not None and reached_cutoff(result[-1]['at']):
+                    break
         
-        # Convert to DataFrame and validate
-        df = self._process_google_data(all_reviews)
-        logger.info(f"✅ Successfully processed {len(df)} Google Play reviews")
+        await asyncio.gather(*(paginate(score) for score in score_filters))
         
-        return df
+        return newest[0] if len(newest) >= max_reviews else None
     
     def fetch_apple_reviews(
         self, 
         app_id: str, 
         country: str = "us", 
-        max_reviews: int = 10000
-    ) -> pd.DataFrame:
+        max_reviews: int = 10000,
+        as_table: bool = False
+    ) -> Union[pd.DataFrame, pa.Table]:
         """
         Fetch reviews from Apple App Store with enhanced error handling.
+        
+        With ``as_table=True`` the reviews are returned as a pyarrow Table
+        and never go through pandas.
+        """
+        try:
+            table = self._run(self.fetch_apple_async, app_id, country, max_reviews)
+        except KeyboardInterrupt:
+            logger.info("Fetch interrupted by user")
+            table = PROCESSED_SCHEMA.empty_table()
+        
+        return self._output(table, as_table)
+    
+    async def fetch_apple_async(
+        self, 
+        app_id: str, 
+        country: str = "us", 
+        max_reviews: int = 10000
+    ) -> pa.Table:
+        """
+        Coroutine behind ``fetch_apple_reviews``, returning a pyarrow Table.
+        
+        Like ``fetch_google_async``, it can be gathered with other fetches
+        on the caller's event loop.
         """
         logger.info(f"Starting Apple App Store reviews fetch for app ID {app_id}")
         logger.info(f"Parameters: country={country}, max_reviews={max_reviews}")
         
-        reviews = []
+        reviews = {name: [] for name in REVIEW_SCHEMA.names}
         
         try:
-            app = AppStoreEntry(app_id=int(app_id), country=country.lower())
-            
-            for idx, review in enumerate(app.reviews()):
-                if len(reviews) >= max_reviews:
-                    logger.info("Reached maximum review limit")
-                    break
-                
-                review_data = {
-                    "reviewId": review.id,
-                    "userName": review.user_name,
-                    "content": review.review,
-                    "score": review.rating,
-                    "at": review.date
-                }
-                
-                reviews.append(review_data)
-                self.stats['fetched'] += 1
-                
-                # Log progress every 100 reviews
-                if (idx + 1) % 100 == 0:
-                    logger.info(f"✅ Fetched {idx + 1} reviews...")
-                
-                # Respect rate limits
-                if self.delay > 0 and idx % 10 == 0:
-                    time.sleep(self.delay / 10)
-                    
-        except KeyboardInterrupt:
-            logger.info("Fetch interrupted by user")
+            async with self._session_scope():
+                await self._fetch_apple_async(app_id, country, max_reviews, reviews)
         except Exception as e:
-            logger.error(f"Error fetching Apple reviews: {e}")
+            logger.error(f"Error fetching Apple reviews for {app_id}: {e}")
             self.stats['errors'] += 1
         
-        if not reviews:
+        if not reviews['reviewId']:
             logger.warning("No Apple reviews were fetched")
-            return pd.DataFrame()
+            return PROCESSED_SCHEMA.empty_table()
+        
+        # Convert to a table and validate
+        table = self._process(reviews, 'apple')
+        logger.info(f"✅ Successfully processed {table.num_rows} Apple App Store reviews")
+        
+        return table
+    
+    def fetch_batch(
+        self,
+        apps: List[Dict[str, str]],
+        lang: str = "en",
+        country: str = "us",
+        max_reviews: int = 10000
+    ) -> List[Tuple[str, str, pa.Table]]:
+        """
+        Fetch Google Play and App Store reviews for several apps concurrently.
         
-        # Convert to DataFrame and validate
-        df = self._process_apple_data(reviews)
-        logger.info(f"✅ Successfully processed {len(df)} Apple App Store reviews")
+        Args:
+            apps: Entries with a ``google_id`` and/or an ``apple_id``
+            lang: Language code for Google Play
+            country: Country code for both stores
+            max_reviews: Maximum number of reviews per app and platform
         
-        return df
+        Returns:
+            ``(platform, app_id, table)`` for every fetch that completed
+        """
+        logger.info(f"Starting batch fetch for {len(apps)} apps")
+        return self._run(self._fetch_batch_async, apps, lang, country, max_reviews)
     
-    def _process_google_data(self, reviews: List[Dict]) -> pd.DataFrame:
-        """Process and validate Google Play review data."""
+    async def _fetch_batch_async(
+        self,
+        apps: List[Dict[str, str]],
+        lang: str,
+        country: str,
+        max_reviews: int
+    ) -> List[Tuple[str, str, pa.Table]]:
+        """Run every fetch in ``apps`` on one event loop as a single gather."""
+        jobs = [('google', app['google_id']) for app in apps if app.get('google_id')]
+        jobs += [('apple', app['apple_id']) for app in apps if app.get('apple_id')]
+        
+        results = await asyncio.gather(
+            *(
+                self.fetch_google_async(app_id, lang, country, max_reviews)
+                if platform == 'google'
+                else self.fetch_apple_async(app_id, country, max_reviews)
+                for platform, app_id in jobs
+            ),
+            return_exceptions=True
+        )
+        
+        batch = []
+        for (platform, app_id), result in zip(jobs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {platform} reviews for {app_id}: {result}")
+                self.stats['errors'] += 1
+                continue
+            batch.append((platform, app_id, result))
+        
+        return batch
+    
+    async def _fetch_apple_async(
+        self,
+        app_id: str,
+        country: str,
+        max_reviews: int,
+        reviews: Dict[str, List]
+    ) -> None:
+        """
+        Fetch the App Store reviews feed pages concurrently.
+        
+        Pages are addressed by number, so once the first page is in, all
+        further pages needed for ``max_reviews`` are requested at once and
+        appended to the ``reviews`` columns in page order. The first page
+        is always fetched live, and cached pages are keyed by its newest
+        review, so any new review invalidates them. Repeated review IDs
+        are dropped in case the feed shifts during a run.
+        """
+        max_pages = min(APPLE_MAX_PAGES, -(-max_reviews // APPLE_PAGE_SIZE))
+        if max_reviews > APPLE_MAX_PAGES * APPLE_PAGE_SIZE:
+            logger.info(
+                f"App Store feed is limited to {APPLE_MAX_PAGES * APPLE_PAGE_SIZE} "
+                f"reviews per country"
+            )
+        
+        if max_pages <= 0:
+            return
+        
         try:
-            df = pd.DataFrame(reviews)
-            
-            # Validate required columns
-            required_cols = ['reviewId', 'userName', 'content', 'score', 'at']
-            missing_cols = [col for col in required_cols if col not in df.columns]
-            
-            if missing_cols:
-                logger.error(f"Missing required columns: {missing_cols}")
-                return pd.DataFrame()
-            
-            # Clean and validate data
-            df['at'] = pd.to_datetime(df['at'])
-            df['content'] = df['content'].fillna('')
-            df['userName'] = df['userName'].fillna('Anonymous')
-            df['score'] = pd.to_numeric(df['score'], errors='coerce')
-            
-            # Remove invalid scores
-            df = df[df['score'].between(1, 5)]
-            
-            # Add metadata
-            df['platform'] = 'google'
-            df['fetched_at'] = datetime.now()
+            first = await self._fetch_apple_page(app_id, country, 1)
+        except AppNotFoundError:
+            raise
+        except Exception as e:
+            first = e
+        
+        # An empty first page means the app has no reviews at all
+        head = first['reviewId'][0] if isinstance(first, dict) and first['reviewId'] else None
+        if isinstance(first, dict) and head is None:
+            max_pages = 1
+        
+        def fetch_page(page: int):
+            fetch = functools.partial(self._fetch_apple_page, app_id, country, page)
+            if head is None:
+                return fetch()
+            return self._cached(('apple', app_id, country, head, page), fetch)
+        
+        pages = [first] + await asyncio.gather(
+            *(fetch_page(page) for page in range(2, max_pages + 1)),
+            return_exceptions=True
+        )
+        
+        seen = set()
+        for page, page_reviews in enumerate(pages, start=1):
+            if isinstance(page_reviews, Exception):
+                if isinstance(page_reviews, AppNotFoundError):
+                    raise page_reviews
+                logger.error(f"Error fetching page {page}: {page_reviews}")
+                self.stats['errors'] += 1
+                continue
             
-            # Flag security-related reviews
-            df['is_security_related'] = df['content'].str.lower().str.contains(
-                '|'.join(SECURITY_KEYWORDS), na=False
-            )
+            if not page_reviews['reviewId']:
+                logger.info("No more reviews available")
+                break
             
-            self.stats['security_related'] = df['is_security_related'].sum()
+            new = [i for i, review_id in enumerate(page_reviews['reviewId'])
+                   if review_id not in seen]
+            new = new[:max_reviews - len(reviews['reviewId'])]
+            seen.update(page_reviews['reviewId'][i] for i in new)
+            for name, values in page_reviews.items():
+                reviews[name].extend(values[i] for i in new)
+            self.stats['fetched'] += len(new)
             
-            return df[required_cols + ['platform', 'fetched_at', 'is_security_related']]
+            logger.info("✅ Fetched %d reviews...", len(reviews['reviewId']))
             
-        except Exception as e:
-            logger.error(f"Error processing Google data: {e}")
-            return pd.DataFrame()
+            if len(reviews['reviewId']) >= max_reviews:
+                logger.info("Reached maximum review limit")
+                break
+    
+    async def _fetch_apple_page(self, app_id: str, country: str, page: int) -> Dict[str, List]:
+        """Fetch one page of the App Store reviews feed as review columns."""
+        url = APPLE_REVIEWS_URL.format(country=country.lower(), page=page, app_id=int(app_id))
+        response = await self._request(APPLE_HOST, self._session.get, url, timeout=REQUEST_TIMEOUT)
+        feed = response.json()['feed']
+        
+        # Unknown app IDs return an empty feed without a "self" link
+        links = feed.get('link', [])
+        if isinstance(links, dict):
+            links = [links]
+        if not any(link['attributes'].get('rel') == 'self' for link in links):
+            raise AppNotFoundError(f"No app with ID {app_id} found in country '{country}'")
+        
+        entries = feed.get('entry', [])
+        if isinstance(entries, dict):
+            entries = [entries]
+        
+        return {
+            'reviewId': [entry['id']['label'] for entry in entries],
+            'userName': [entry['author']['name']['label'] for entry in entries],
+            'content': [entry['content']['label'] for entry in entries],
+            'score': [int(entry['im:rating']['label']) for entry in entries],
+            'at': [entry['updated']['label'] for entry in entries],
+        }
     
-    def _process_apple_data(self, reviews: List[Dict]) -> pd.DataFrame:
-        """Process and validate Apple App Store review data."""
+    def _process(self, reviews: Dict[str, List], platform: str) -> pa.Table:
+        """Process and validate review columns fetched from ``platform``."""
         try:
-            df = pd.DataFrame(reviews)
+            table = self._to_table(reviews)
             
-            if df.empty:
-                return df
-            
-            # Clean and validate data
-            df['at'] = pd.to_datetime(df['at'])
-            df['content'] = df['content'].fillna('')
-            df['userName'] = df['userName'].fillna('Anonymous')
-            df['score'] = pd.to_numeric(df['score'], errors='coerce')
-            
-            # Remove invalid scores
-            df = df[df['score'].between(1, 5)]
+            # Drop invalid scores and missing timestamps in one masked pass
+            score = table.column('score')
+            mask = pc.and_(
+                pc.and_(pc.greater_equal(score, 1), pc.less_equal(score, 5)),
+                pc.is_valid(table.column('at'))
+            )
+            table = table.filter(mask)
+            row_count = table.num_rows
             
             # Add metadata
-            df['platform'] = 'apple'
-            df['fetched_at'] = datetime.now()
+            platform_codes = pa.array(np.zeros(row_count, dtype='int8'))
+            table = table.append_column(
+                PROCESSED_SCHEMA.field('platform'),
+                pa.DictionaryArray.from_arrays(platform_codes, pa.array([platform]))
+            )
+            table = table.append_column(
+                PROCESSED_SCHEMA.field('fetched_at'),
+                pa.array(np.full(row_count, np.datetime64('now', 's')))
+            )
             
             # Flag security-related reviews
-            df['is_security_related'] = df['content'].str.lower().str.contains(
-                '|'.join(SECURITY_KEYWORDS), na=False
+            is_security_related = _match_security(table.column('content'))
+            table = table.append_column(
+                PROCESSED_SCHEMA.field('is_security_related'), is_security_related
             )
             
-            self.stats['security_related'] = df['is_security_related'].sum()
+            self.stats['security_related'] += pc.sum(is_security_related).as_py() or 0
             
-            return df[['reviewId', 'userName', 'content', 'score', 'at', 
-                      'platform', 'fetched_at', 'is_security_related']]
+            return table
             
         except Exception as e:
-            logger.error(f"Error processing Apple data: {e}")
-            return pd.DataFrame()
+            logger.error(f"Error processing {platform} data: {e}")
+            return PROCESSED_SCHEMA.empty_table()
     
-    def save_reviews(self, df: pd.DataFrame, filename: str, 
-                    save_processed: bool = True) -> str:
+    @staticmethod
+    def _to_table(columns: Dict[str, List]) -> pa.Table:
+        """Build an Arrow table from review columns in REVIEW_SCHEMA."""
+        columns = dict(columns, at=_to_timestamps(columns['at']))
+        table = pa.table(columns, schema=REVIEW_SCHEMA)
+        
+        # Fill missing text in Arrow, before any pandas column exists
+        for name, default in (('content', ''), ('userName', 'Anonymous')):
+            index = table.schema.get_field_index(name)
+            table = table.set_column(index, name, pc.fill_null(table.column(index), default))
+        
+        return table
+    
+    @staticmethod
+    def _output(table: pa.Table, as_table: bool) -> Union[pd.DataFrame, pa.Table]:
+        """Return processed reviews as a table or an Arrow-backed DataFrame."""
+        if as_table:
+            return table
+        return table.to_pandas(types_mapper=REVIEW_DTYPES.get)
+    
+    def save_reviews(self, reviews: Union[pd.DataFrame, pa.Table], filename: str, 
+                    save_processed: bool = True,
+                    output_format: str = 'parquet') -> str:
         """
-        Save reviews to CSV with optional processed version.
+        Save reviews to Parquet (or CSV) with optional processed version.
+        
+        Accepts a DataFrame or the pyarrow Table returned with
+        ``as_table=True``; tables are written without a pandas round trip.
         """
-        if df.empty:
+        if not len(reviews):
             logger.warning("No data to save")
             return ""
         
         # Save raw data
-        raw_path = os.path.join(RAW_DIR, f"{filename}.csv")
-        df.to_csv(raw_path, index=False)
+        raw_path = os.path.join(RAW_DIR, f"{filename}.{output_format}")
+        self._write(reviews, raw_path, output_format)
         logger.info(f"✅ Raw data saved to: {raw_path}")
         
         if save_processed:
-            # Save processed version with additional analysis
-            processed_df = df.copy()
-            
-            # Add basic statistics
-            processed_df['content_length'] = processed_df['content'].str.len()
-            processed_df['word_count'] = processed_df['content'].str.split().str.len()
+            # Save processed version with basic statistics added
+            if isinstance(reviews, pa.Table):
+                processed = _add_text_stats(reviews)
+            else:
+                stats = _add_text_stats(pa.table({'content': pa.array(reviews['content'])}))
+                # Missing content becomes NaN, as with the pandas string methods
+                processed = reviews.assign(
+                    content_length=stats.column('content_length').to_numpy(),
+                    word_count=stats.column('word_count').to_numpy()
+                )
             
             # Save processed data
-            processed_path = os.path.join(PROCESSED_DIR, f"{filename}_processed.csv")
-            processed_df.to_csv(processed_path, index=False)
+            processed_path = os.path.join(
+                PROCESSED_DIR, f"{filename}_processed.{output_format}"
+            )
+            self._write(processed, processed_path, output_format)
             logger.info(f"✅ Processed data saved to: {processed_path}")
         
         return raw_path
     
+    @staticmethod
+    def _write(reviews: Union[pd.DataFrame, pa.Table], path: str, output_format: str):
+        """Write a DataFrame or Arrow table in the requested output format."""
+        if output_format == 'csv':
+            # Format rows from the Arrow buffers in C++ rather than through pandas
+            if isinstance(reviews, pd.DataFrame):
+                reviews = pa.Table.from_pandas(reviews, preserve_index=False)
+            pcsv.write_csv(reviews, path, write_options=pcsv.WriteOptions(include_header=True))
+        elif isinstance(reviews, pa.Table):
+            pq.write_table(
+                reviews,
+                path,
+                compression=PARQUET_COMPRESSION,
+                row_group_size=PARQUET_ROW_GROUP_SIZE
+            )
+        else:
+            reviews.to_parquet(
+                path,
+                engine='pyarrow',
+                compression=PARQUET_COMPRESSION,
+                row_group_size=PARQUET_ROW_GROUP_SIZE,
+                index=False
+            )
+    
     def print_stats(self):
         """Print fetching statistics."""
         logger.info("=== FETCH STATISTICS ===")
@@ -313,12 +1077,51 @@ class ReviewFetcher:
 def validate_app_id(platform: str, app_id: str) -> bool:
     """Validate app ID format for the given platform."""
     if platform == 'google':
-        return '.' in app_id and len(app_id.split('.')) >= 2
+        return GOOGLE_APP_ID_RE.fullmatch(app_id) is not None
     elif platform == 'apple':
-        return app_id.isdigit() and len(app_id) >= 6
+        return APPLE_APP_ID_RE.fullmatch(app_id) is not None
     return False
 
 
+def load_apps(path: str) -> List[Dict[str, str]]:
+    """
+    Load a batch config listing apps to fetch from both stores.
+    
+    The YAML file holds a list of entries with a ``google_id`` and/or an
+    ``apple_id`` (optionally under a top-level ``apps`` key)::
+    
+        - google_id: com.wsandroid.suite
+          apple_id: 724596345
+    
+    Raises:
+        ValueError: If the config is malformed or lists an invalid app ID
+    """
+    with open(path, encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    if isinstance(config, dict):
+        config = config.get('apps')
+    if not isinstance(config, list) or not config:
+        raise ValueError(f"{path} must contain a list of apps")
+    
+    apps = []
+    for entry in config:
+        if not isinstance(entry, dict):
+            raise ValueError(f"Invalid app entry in {path}: {entry!r}")
+        
+        # Numeric App Store IDs are parsed as ints by YAML
+        app = {key: str(entry[key]) for key in ('google_id', 'apple_id') if entry.get(key)}
+        if not app:
+            raise ValueError(f"App entry needs a google_id or apple_id: {entry!r}")
+        
+        for key, platform in (('google_id', 'google'), ('apple_id', 'apple')):
+            if key in app and not validate_app_id(platform, app[key]):
+                raise ValueError(f"Invalid app ID '{app[key]}' for platform '{platform}'")
+        apps.append(app)
+    
+    return apps
+
+
 def main():
     """Main function with enhanced argument parsing and validation."""
     parser = argparse.ArgumentParser(
@@ -331,19 +1134,23 @@ Examples:
   
   # Fetch Apple App Store reviews
   python fetch_reviews.py --platform apple --app_id 724596345 --country us --max_reviews 500
+  
+  # Fetch both stores for every app in a batch config
+  python fetch_reviews.py --apps apps.yaml --max_reviews 500
         """
     )
     
-    # Required arguments
+    # Required arguments (unless --apps is given)
     parser.add_argument('--platform', 
                        choices=['google', 'apple'], 
-                       required=True,
                        help='Platform to fetch reviews from')
     
     parser.add_argument('--app_id', 
-                       required=True,
                        help='App ID (package name for Google, numeric ID for Apple)')
     
+    parser.add_argument('--apps', 
+                       help='YAML file listing google_id/apple_id pairs to fetch concurrently')
+    
     # Optional arguments
     parser.add_argument('--country', 
                        default='us',
@@ -362,10 +1169,29 @@ Examples:
                        default=1.0,
                        help='Delay between requests in seconds (default: 1.0)')
     
+    parser.add_argument('--concurrency', 
+                       type=int, 
+                       default=8,
+                       help='Maximum concurrent requests (default: 8)')
+    
     parser.add_argument('--lang', 
                        default='en',
                        help='Language code for Google Play (default: en)')
     
+    parser.add_argument('--no_cache', 
+                       action='store_true',
+                       help='Do not read or write the on-disk page cache')
+    
+    parser.add_argument('--format', 
+                       choices=OUTPUT_FORMATS, 
+                       default='parquet',
+                       help='Output file format (default: parquet)')
+    
+    parser.add_argument('--stream', 
+                       action='store_true',
+                       help='Write Google Play reviews (raw and processed) to Parquet as '
+                            'they are fetched (keeps memory low for large fetches)')
+    
     parser.add_argument('--verbose', 
                        action='store_true',
                        help='Enable verbose logging')
@@ -376,49 +1202,86 @@ Examples:
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    if args.apps:
+        if args.platform or args.app_id or args.output or args.stream:
+            parser.error("--apps cannot be combined with --platform, --app_id, --output or --stream")
+    elif not (args.platform and args.app_id):
+        parser.error("--platform and --app_id are required unless --apps is given")
+    
     # Validate app ID
-    if not validate_app_id(args.platform, args.app_id):
+    if args.app_id and not validate_app_id(args.platform, args.app_id):
         logger.error(f"Invalid app ID '{args.app_id}' for platform '{args.platform}'")
         sys.exit(1)
     
     # Initialize fetcher
-    fetcher = ReviewFetcher(delay=args.delay)
+    fetcher = ReviewFetcher(
+        delay=args.delay,
+        concurrency=args.concurrency,
+        cache_dir=None if args.no_cache else CACHE_DIR
+    )
+    
+    if args.stream and (args.platform != 'google' or args.format != 'parquet'):
+        parser.error("--stream requires --platform google and --format parquet")
+    
+    # Generate filename
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    if args.apps:
+        run_batch(fetcher, args, timestamp)
+        return
+    
+    if args.output:
+        filename = args.output
+    else:
+        filename = f"{args.platform}_{args.app_id}_{timestamp}"
     
     try:
         # Fetch reviews
-        if args.platform == 'google':
-            df = fetcher.fetch_google_reviews(
+        if args.stream:
+            saved_path = os.path.join(RAW_DIR, f"{filename}.parquet")
+            review_count = fetcher.stream_google_reviews(
                 app_id=args.app_id,
+                path=saved_path,
                 lang=args.lang,
                 country=args.country,
-                max_reviews=args.max_reviews
-            )
-        else:  # apple
-            df = fetcher.fetch_apple_reviews(
-                app_id=args.app_id,
-                country=args.country,
-                max_reviews=args.max_reviews
+                max_reviews=args.max_reviews,
+                processed_path=os.path.join(PROCESSED_DIR, f"{filename}_processed.parquet")
             )
-        
-        if df.empty:
-            logger.error("No reviews were fetched. Exiting.")
-            sys.exit(1)
-        
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if args.output:
-            filename = args.output
+            
+            if not review_count:
+                logger.error("No reviews were fetched. Exiting.")
+                sys.exit(1)
         else:
-            filename = f"{args.platform}_{args.app_id}_{timestamp}"
-        
-        # Save data
-        saved_path = fetcher.save_reviews(df, filename)
+            # Output is written straight from Arrow, skipping pandas
+            if args.platform == 'google':
+                reviews = fetcher.fetch_google_reviews(
+                    app_id=args.app_id,
+                    lang=args.lang,
+                    country=args.country,
+                    max_reviews=args.max_reviews,
+                    as_table=True
+                )
+            else:  # apple
+                reviews = fetcher.fetch_apple_reviews(
+                    app_id=args.app_id,
+                    country=args.country,
+                    max_reviews=args.max_reviews,
+                    as_table=True
+                )
+            
+            review_count = len(reviews)
+            if not review_count:
+                logger.error("No reviews were fetched. Exiting.")
+                sys.exit(1)
+            
+            # Save data
+            saved_path = fetcher.save_reviews(reviews, filename, output_format=args.format)
         
         # Print statistics
         fetcher.print_stats()
         
         logger.info("=== SUMMARY ===")
-        logger.info(f"✅ Successfully fetched {len(df)} reviews")
+        logger.info(f"✅ Successfully fetched {review_count} reviews")
         logger.info(f"📁 Data saved to: {saved_path}")
         logger.info("🎉 Fetch completed successfully!")
         
@@ -430,5 +1293,54 @@ Examples:
         sys.exit(1)
 
 
+def run_batch(fetcher: ReviewFetcher, args: argparse.Namespace, timestamp: str):
+    """Fetch and save every app listed in the ``--apps`` config."""
+    try:
+        apps = load_apps(args.apps)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        logger.error(f"Could not load apps config: {e}")
+        sys.exit(1)
+    
+    try:
+        results = fetcher.fetch_batch(
+            apps,
+            lang=args.lang,
+            country=args.country,
+            max_reviews=args.max_reviews
+        )
+        
+        saved_paths = []
+        review_count = 0
+        for platform, app_id, table in results:
+            if not table.num_rows:
+                logger.warning(f"No {platform} reviews were fetched for {app_id}")
+                continue
+            
+            saved_paths.append(fetcher.save_reviews(
+                table, f"{platform}_{app_id}_{timestamp}", output_format=args.format
+            ))
+            review_count += table.num_rows
+        
+        if not saved_paths:
+            logger.error("No reviews were fetched. Exiting.")
+            sys.exit(1)
+        
+        # Print statistics
+        fetcher.print_stats()
+        
+        logger.info("=== SUMMARY ===")
+        logger.info(f"✅ Successfully fetched {review_count} reviews for {len(apps)} apps")
+        for path in saved_paths:
+            logger.info(f"📁 Data saved to: {path}")
+        logger.info("🎉 Batch fetch completed successfully!")
+        
+    except KeyboardInterrupt:
+        logger.info("Operation cancelled by user")
+        sys.exit(0)
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()